@@ -1,35 +1,115 @@
 import argparse
+import hashlib
 import os
-from docx import Document
+from collections import OrderedDict
 from configparser import ConfigParser
 import ipaddress
-from fuzzywuzzy import fuzz
 import json
 import xml.etree.ElementTree as ET
-import openpyxl
-from openpyxl.utils.exceptions import InvalidFileException
 
-def search_files(directory, extensions, search_terms):
+# openpyxl, python-docx and fuzzywuzzy are imported where they are first
+# needed, so plain-text and IP/MAC searches start without loading them.
+
+DEFAULT_CACHE_SIZE = 100000  # distinct lines kept in the fuzzy match cache
+
+# Content is compared with surrounding whitespace (including the trailing
+# newline) removed and lowercased, so a line matches the same wherever it appears
+def normalize_content(content):
+    return content.strip().lower()
+
+# Cache keys are SHA-1 hex digests
+def is_digest(key):
+    return isinstance(key, str) and len(key) == 40 and all(c in '0123456789abcdef' for c in key)
+
+# Bounded LRU memo of fuzzy match scores. Log files repeat the same lines
+# heavily, so each distinct normalized line is only compared once per term
+# and repeats cost a hash lookup instead of a fuzz.partial_ratio call.
+# Entries are keyed by a SHA-1 digest of the line, so searched content is
+# never kept in the cache or written to the cache file.
+class FuzzyMatchCache:
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()  # line digest -> {lowercased term: score}
+        self.hits = 0
+        self.misses = 0
+
+    # Return the {term: score} entry for normalized content, hashing it once
+    def scores_for(self, content):
+        key = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        scores = self.entries.get(key)
+        if scores is None:
+            scores = self.entries[key] = {}
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)  # drop the least recently used line
+        else:
+            self.entries.move_to_end(key)
+        return scores
+
+    # Score a term against normalized content, using its entry from scores_for()
+    def score(self, term, content, scores):
+        term = term.lower()
+        if term in scores:
+            self.hits += 1
+            return scores[term]
+        self.misses += 1
+        from fuzzywuzzy import fuzz
+        scores[term] = fuzz.partial_ratio(term, content)
+        return scores[term]
+
+    # Load cached scores saved by a previous run
+    def load(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return  # Start with an empty cache if the file is missing or unreadable
+        if not isinstance(data, list):
+            return  # Not a cache file; start with an empty cache
+        for entry in data[-self.max_size:]:
+            # Only accept [digest, {term: score}] pairs, so a malformed file or
+            # one holding raw lines is never reloaded and saved back
+            if (isinstance(entry, list) and len(entry) == 2 and is_digest(entry[0])
+                    and isinstance(entry[1], dict)):
+                self.entries[entry[0]] = entry[1]
+
+    # Save cached scores, least recently used first
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as cache_file:
+            json.dump(list(self.entries.items()), cache_file)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups if lookups else 0.0
+        return (f"Fuzzy match cache: {lookups} lookup(s), {self.hits} hit(s) ({rate:.1%}), "
+                f"{self.misses} comparison(s), {len(self.entries)} cached line(s)")
+
+def search_files(directory, extensions, search_terms, cache=None, skip_paths=()):
     # Initialize the files_found dictionary to store results
     files_found = {term: {"text": set(), "json": set(), "xml": set()} for term in search_terms}
     threshold = 75  # Lowering the threshold to 30 for partial matching
+    skip_paths = {os.path.normcase(os.path.abspath(path)) for path in skip_paths}
 
     # Walk through the directory
     for root, dirs, files in os.walk(directory):
         for file_name in files:
             file_path = os.path.join(root, file_name)
 
+            # Skip files the search itself writes, such as the match cache
+            if os.path.normcase(os.path.abspath(file_path)) in skip_paths:
+                continue
+
             # Skip Excel files here and handle them separately
             if file_name.endswith('.xlsx'):
+                import openpyxl
+                from openpyxl.utils.exceptions import InvalidFileException
                 try:
                     workbook = openpyxl.load_workbook(file_path, read_only=True)
                     for sheet in workbook.worksheets:
                         for row in sheet.iter_rows():
                             for cell in row:
                                 cell_value = cell.value
-                                for term in search_terms:
-                                    handle_search(term, str(cell_value), file_path, files_found, threshold)
-                except openpyxl.utils.exceptions.InvalidFileException:
+                                search_content(str(cell_value), file_path, search_terms, files_found, threshold, cache)
+                except InvalidFileException:
                     pass  # Skip invalid Excel files
                 continue  # Skip the file if it's an Excel file
 
@@ -37,16 +117,15 @@ def search_files(directory, extensions, search_terms):
             if file_name.endswith(tuple(extensions)):
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
                     for line in file:
-                        for term in search_terms:
-                            handle_search(term, line, file_path, files_found, threshold)
+                        search_content(line, file_path, search_terms, files_found, threshold, cache)
 
             # Handle .docx files
             elif file_name.endswith('.docx'):
+                from docx import Document
                 try:
                     document = Document(file_path)
                     for paragraph in document.paragraphs:
-                        for term in search_terms:
-                            handle_search(term, paragraph.text, file_path, files_found, threshold)
+                        search_content(paragraph.text, file_path, search_terms, files_found, threshold, cache)
                 except Exception as e:
                     pass  # Skip any errors related to .docx files
 
@@ -57,9 +136,8 @@ def search_files(directory, extensions, search_terms):
                     config.read(file_path)
                     for section in config.sections():
                         for option, value in config.items(section):
-                            for term in search_terms:
-                                handle_search(term, option, file_path, files_found, threshold)
-                                handle_search(term, value, file_path, files_found, threshold)
+                            search_content(option, file_path, search_terms, files_found, threshold, cache)
+                            search_content(value, file_path, search_terms, files_found, threshold, cache)
                 except Exception as e:
                     pass  # Skip any errors related to .ini files
 
@@ -69,8 +147,7 @@ def search_files(directory, extensions, search_terms):
                     with open(file_path, 'r') as json_file:
                         json_data = json.load(json_file)
                         json_content = json.dumps(json_data)
-                        for term in search_terms:
-                            handle_search(term, json_content, file_path, files_found, threshold)
+                        search_content(json_content, file_path, search_terms, files_found, threshold, cache)
                 except Exception as e:
                     pass  # Skip any errors related to .json files
 
@@ -80,18 +157,33 @@ def search_files(directory, extensions, search_terms):
                     tree = ET.parse(file_path)
                     root = tree.getroot()
                     xml_content = ET.tostring(root, encoding='unicode', method='xml')
-                    for term in search_terms:
-                        handle_search(term, xml_content, file_path, files_found, threshold)
+                    search_content(xml_content, file_path, search_terms, files_found, threshold, cache)
                 except Exception as e:
                     pass  # Skip any errors related to .xml files
 
     return files_found
 
-# Helper function to search terms in content and store results
-def handle_search(term, content, file_path, files_found, threshold):
-    if term.startswith('IP-') or term.startswith('MAC-'):
-        handle_ip_mac_search(term, content, file_path, files_found)
-    elif fuzz.partial_ratio(term.lower(), content.lower()) >= threshold:
+# Search one piece of content for every term. For keyword terms the content is
+# normalized (and hashed, with a cache) once, so only the per-term lookup repeats
+def search_content(content, file_path, search_terms, files_found, threshold, cache=None):
+    normalized = scores = None
+    for term in search_terms:
+        if term.startswith('IP-') or term.startswith('MAC-'):
+            handle_ip_mac_search(term, content, file_path, files_found)
+            continue
+        if normalized is None:
+            normalized = normalize_content(content)
+            scores = cache.scores_for(normalized) if cache is not None else None
+        handle_search(term, normalized, file_path, files_found, threshold, cache, scores)
+
+# Helper function to fuzzy match a keyword against normalized content and store results
+def handle_search(term, normalized, file_path, files_found, threshold, cache=None, scores=None):
+    if cache is not None:
+        score = cache.score(term, normalized, scores)
+    else:
+        from fuzzywuzzy import fuzz
+        score = fuzz.partial_ratio(term.lower(), normalized)
+    if score >= threshold:
         if file_path.endswith('.json'):
             files_found[term]["json"].add(file_path)
         elif file_path.endswith('.xml'):
@@ -132,8 +224,13 @@ def main():
     parser.add_argument("-K", "--keywords", dest="keywords", help="Keywords separated by commas.")
     parser.add_argument("-I", "--ip", dest="ip_addresses", help="IP addresses separated by commas. Enclose in double quotes.")
     parser.add_argument("-M", "--mac", dest="mac_addresses", help="MAC addresses separated by commas. Enclose in double quotes.")
+    parser.add_argument("-C", "--cache-size", dest="cache_size", type=int, default=DEFAULT_CACHE_SIZE, help=f"Distinct lines kept in the fuzzy match cache (default {DEFAULT_CACHE_SIZE}, 0 disables the cache).")
+    parser.add_argument("-F", "--cache-file", dest="cache_file", help="File to load the fuzzy match cache from and save it to, so it persists between runs.")
+    parser.add_argument("-S", "--cache-stats", dest="cache_stats", action="store_true", help="Print fuzzy match cache hit-rate statistics after the search.")
 
     args = parser.parse_args()
+    if args.cache_file and args.cache_size <= 0:
+        parser.error("--cache-file needs the fuzzy match cache; remove -C 0 or -F.")
 
     directory = os.path.abspath(args.directory) if args.directory else None
     extensions = ['log', 'txt', 'xlsx', 'csv', 'docx', 'ini', 'json', 'xml']
@@ -143,7 +240,15 @@ def main():
 
     search_terms = keywords + [f"IP-{ip}" for ip in ip_addresses] + [f"MAC-{mac}" for mac in mac_addresses]
 
-    files_found = search_files(directory, extensions, search_terms)
+    cache = FuzzyMatchCache(args.cache_size) if args.cache_size > 0 else None
+    if cache and args.cache_file:
+        cache.load(args.cache_file)
+
+    skip_paths = [args.cache_file] if args.cache_file else []
+    files_found = search_files(directory, extensions, search_terms, cache, skip_paths)
+
+    if cache and args.cache_file:
+        cache.save(args.cache_file)
 
     # Print results
     for term, file_types in files_found.items():
@@ -166,5 +271,8 @@ def main():
         if len(unique_text_files) == 0 and len(unique_json_files) == 0 and len(unique_xml_files) == 0:
             print(f"No files containing the keyword '{term}' were found.")
 
+    if args.cache_stats:
+        print(cache.stats() if cache else "Fuzzy match cache disabled.")
+
 if __name__ == "__main__":
     main()
@@ -1,67 +1,449 @@
 from cryptography.fernet import Fernet
 import os
 import json
+import argparse
+import re
+import threading
+import time
+from collections import Counter, defaultdict, namedtuple
+from contextlib import contextmanager
+from urllib.parse import urlparse
 import tkinter as tk
 from tkinter import Tk, simpledialog, messagebox, ttk, filedialog
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from plexapi.server import PlexServer
 
-# File paths for key and encrypted data
-KEY_FILE = "key.key"
-DATA_FILE = "data.enc"
+# File paths for key and encrypted data (PLEX_CREDENTIALS_DIR overrides the working directory)
+CREDENTIALS_DIR = os.environ.get("PLEX_CREDENTIALS_DIR", "")
+KEY_FILE = os.path.join(CREDENTIALS_DIR, "key.key")
+DATA_FILE = os.path.join(CREDENTIALS_DIR, "data.enc")
+LOCK_TIMEOUT = 10  # seconds to wait for another run to finish updating the store
 
-def generate_key():
+# HTTP settings for the Plex connection
+REQUEST_TIMEOUT = 10   # seconds per request
+MAX_RETRIES = 3        # retries on connection errors and 429/5xx responses
+RETRY_BACKOFF = 0.5    # seconds, doubled after each retry
+POOL_SIZE = 10         # keep-alive connections; also caps concurrent requests
+
+def generate_key(path=KEY_FILE):
     """Generate a new encryption key and save it."""
     key = Fernet.generate_key()
-    with open(KEY_FILE, "wb") as key_file:
+    with open(path, "wb") as key_file:
         key_file.write(key)
     return key
 
-def load_key():
+def load_key(path=KEY_FILE):
     """Load the encryption key from the file."""
-    if not os.path.exists(KEY_FILE):
-        return generate_key()
-    with open(KEY_FILE, "rb") as key_file:
+    if not os.path.exists(path):
+        return generate_key(path)
+    with open(path, "rb") as key_file:
         return key_file.read()
 
-def encrypt_data(data, key):
-    """Encrypt data using the provided key."""
-    fernet = Fernet(key)
-    encrypted = fernet.encrypt(data.encode())
-    with open(DATA_FILE, "wb") as data_file:
-        data_file.write(encrypted)
-
-def decrypt_data(key):
-    """Decrypt data using the provided key."""
-    if not os.path.exists(DATA_FILE):
-        return None
-    with open(DATA_FILE, "rb") as data_file:
-        encrypted = data_file.read()
-    fernet = Fernet(key)
-    return fernet.decrypt(encrypted).decode()
-
-def get_plex_credentials():
-    """Prompt for Plex IP and Token if not already stored."""
-    key = load_key()
-
-    decrypted_data = decrypt_data(key)
-    if decrypted_data:
-        return json.loads(decrypted_data)
-
+class CredentialStore:
+    """Plex servers stored by name in DATA_FILE, each entry encrypted on its own.
+
+    The file is JSON holding the default server name and, per server, a version
+    counter, update time and the Fernet-encrypted IP/token. Looking up a server
+    only decrypts that entry, and decrypted entries are cached per version, so
+    use get_credential_store() to share one store per process. Writes take a
+    lock file and replace the data file atomically, so parallel runs can read
+    and update the store without losing entries.
+    """
+
+    FORMAT = 2
+
+    def __init__(self, key_file=KEY_FILE, data_file=DATA_FILE):
+        self.key_file = key_file
+        self.data_file = data_file
+        self.lock_file = f"{data_file}.lock"
+        self._fernet = None
+        self._cache = {}  # (name, version) -> credentials
+
+    @property
+    def fernet(self):
+        if self._fernet is None:
+            self._fernet = Fernet(load_key(self.key_file))
+        return self._fernet
+
+    @contextmanager
+    def locked(self):
+        """Hold the store's lock file while updating it."""
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.lock_file}; "
+                                       "delete it if no other run is updating the store.")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            os.remove(self.lock_file)
+
+    def _read(self):
+        """Parse the data file; returns (store, migrated).
+
+        Older versions encrypted one {"ip", "token"} object as the whole file;
+        that is converted in memory to a store with a 'default' server.
+        """
+        if not os.path.exists(self.data_file):
+            return {"format": self.FORMAT, "default": None, "servers": {}}, False
+        with open(self.data_file, "rb") as data_file:
+            raw = data_file.read()
+        try:
+            return json.loads(raw), False
+        except ValueError:
+            legacy = json.loads(self.fernet.decrypt(raw).decode())
+            store = {"format": self.FORMAT, "default": None, "servers": {}}
+            self._put(store, "default", legacy["ip"], legacy["token"])
+            return store, True
+
+    def load(self):
+        """Read the store, saving the migration of a single-server file from older versions."""
+        store, migrated = self._read()
+        if migrated:
+            with self.locked():
+                store, migrated = self._read()  # another run may have migrated it already
+                if migrated:
+                    self.save(store)
+        return store
+
+    def save(self, store):
+        tmp_file = f"{self.data_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as data_file:
+            json.dump(store, data_file, indent=2)
+        os.replace(tmp_file, self.data_file)
+
+    def names(self):
+        return sorted(self.load()["servers"])
+
+    def get(self, name=None):
+        """Return {"ip", "token"} for a server (the default if no name), or None."""
+        store = self.load()
+        name = name or store["default"]
+        entry = store["servers"].get(name)
+        if entry is None:
+            return None
+        cache_key = (name, entry["version"])
+        if cache_key not in self._cache:
+            self._cache[cache_key] = json.loads(self.fernet.decrypt(entry["data"].encode()).decode())
+        return self._cache[cache_key]
+
+    def put(self, name, ip, token):
+        """Add or update a server, bumping its version."""
+        with self.locked():
+            store, _ = self._read()
+            self._put(store, name, ip, token)
+            self.save(store)
+
+    def remove(self, name):
+        """Remove a server; returns False if it was not stored."""
+        with self.locked():
+            store, _ = self._read()
+            if store["servers"].pop(name, None) is None:
+                return False
+            if store["default"] == name:
+                store["default"] = min(store["servers"], default=None)
+            self.save(store)
+            return True
+
+    def _put(self, store, name, ip, token):
+        previous = store["servers"].get(name, {})
+        store["servers"][name] = {
+            "version": previous.get("version", 0) + 1,
+            "updated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "data": self.fernet.encrypt(json.dumps({"ip": ip, "token": token}).encode()).decode(),
+        }
+        if not store["default"]:
+            store["default"] = name
+
+_credential_store = None
+
+def get_credential_store():
+    """Return the process-wide CredentialStore, so its decrypt cache is shared."""
+    global _credential_store
+    if _credential_store is None:
+        _credential_store = CredentialStore()
+    return _credential_store
+
+def get_plex_credentials(name=None, prompt=True):
+    """Return stored credentials for a server, prompting for them if missing.
+
+    With prompt=False (headless runs) a missing server raises ValueError
+    instead of opening a Tk dialog.
+    """
+    credentials = get_credential_store().get(name)
+    if credentials:
+        return credentials
+
+    name = name or "default"
+    if not prompt:
+        raise ValueError(f"No stored credentials for Plex server '{name}'.")
+    return prompt_plex_credentials(name)
+
+def prompt_plex_credentials(name):
+    """Prompt for a server's Plex IP and Token and store them under its name."""
     root = Tk()
     root.withdraw()
-    ip = simpledialog.askstring("Plex Server IP", "Enter Plex Server IP:")
-    token = simpledialog.askstring("Plex Token", "Enter Plex Token:", show="*")
+    ip = simpledialog.askstring("Plex Server IP", f"Enter Plex Server IP for '{name}':")
+    token = simpledialog.askstring("Plex Token", f"Enter Plex Token for '{name}':", show="*")
 
     if not ip or not token:
         messagebox.showerror("Error", "IP and Token are required.")
         raise ValueError("IP and Token are required.")
+    root.destroy()
 
-    data = json.dumps({"ip": ip, "token": token})
-    encrypt_data(data, key)
+    get_credential_store().put(name, ip, token)
     return {"ip": ip, "token": token}
 
+def endpoint(url):
+    """URL path with numeric ids (ratingKeys) collapsed, e.g. /playlists/{id}/items."""
+    return re.sub(r"/\d+(?=/|$)", "/{id}", urlparse(url).path)
+
+class RequestMetrics:
+    """Thread-safe request, round-trip and latency totals, overall and per endpoint.
+
+    A request is one call made by plexapi; it costs one round trip plus one
+    for every retry urllib3 makes before the final response.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.round_trips = 0
+        self.retries = Counter()  # retry reason (status code or error) -> count
+        self.errors = 0
+        self.total_time = 0.0
+        self.by_path = defaultdict(lambda: [0, 0, 0.0])  # endpoint -> [requests, round trips, seconds]
+
+    def record(self, url, elapsed, ok):
+        """Record a finished request, including the time spent on its retries."""
+        with self.lock:
+            self.requests += 1
+            self.round_trips += 1
+            self.total_time += elapsed
+            if not ok:
+                self.errors += 1
+            stats = self.by_path[endpoint(url)]
+            stats[0] += 1
+            stats[1] += 1
+            stats[2] += elapsed
+
+    def record_retry(self, url, reason):
+        """Record a failed attempt that urllib3 is about to retry."""
+        with self.lock:
+            self.round_trips += 1
+            self.retries[reason] += 1
+            self.by_path[endpoint(url)][1] += 1
+
+    def summary(self):
+        with self.lock:
+            avg_ms = self.total_time / self.requests * 1000 if self.requests else 0.0
+            return (f"{self.requests} request(s), {self.round_trips} round trip(s), "
+                    f"{sum(self.retries.values())} retry(s), {self.errors} error(s), "
+                    f"avg {avg_ms:.0f} ms, total {self.total_time:.2f} s")
+
+    def report(self):
+        lines = [f"Plex requests: {self.summary()}"]
+        with self.lock:
+            if self.retries:
+                lines.append("Retries: " + ", ".join(f"{reason} x{n}" for reason, n in self.retries.most_common()))
+            paths = sorted(self.by_path.items(), key=lambda item: item[1][2], reverse=True)
+        for path, (count, trips, seconds) in paths:
+            avg_ms = seconds / count * 1000 if count else 0.0
+            lines.append(f"- {path}: {count} request(s), {trips} round trip(s), avg {avg_ms:.0f} ms")
+        return "\n".join(lines)
+
+class InstrumentedRetry(Retry):
+    """urllib3 Retry that reports every retried attempt to a RequestMetrics."""
+
+    metrics = None
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.metrics = self.metrics
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, *args, **kwargs):
+        # Raises once retries are exhausted, in which case no further attempt is made
+        retry = super().increment(method, url, response, error, *args, **kwargs)
+        if self.metrics is not None:
+            reason = response.status if response is not None else type(error).__name__
+            self.metrics.record_retry(url or "", str(reason))
+        return retry
+
+class InstrumentedSession(requests.Session):
+    """requests session that records the latency and outcome of every request."""
+
+    def __init__(self, metrics):
+        super().__init__()
+        self.metrics = metrics
+
+    def request(self, method, url, *args, **kwargs):
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            ok = response.ok
+            return response
+        finally:
+            self.metrics.record(url, time.perf_counter() - start, ok)
+
+def make_session(metrics):
+    """Session with a pooled keep-alive adapter and bounded retry/backoff."""
+    session = InstrumentedSession(metrics)
+    retry = InstrumentedRetry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD", "OPTIONS"),
+        raise_on_status=False,  # let plexapi report the final error response
+    )
+    retry.metrics = metrics
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+                          pool_block=True, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def connect(ip, token, metrics=None, baseurl=None):
+    """Connect to the Plex server at the given IP (or baseurl) through a configured session."""
+    session = make_session(metrics if metrics is not None else RequestMetrics())
+    return PlexServer(baseurl or f"http://{ip}:32400", token, session=session, timeout=REQUEST_TIMEOUT)
+
+Track = namedtuple("Track", ["rating_key", "title", "artist", "album"])
+
+def format_track(track):
+    return f"{track.title} by {track.artist} (Album: {track.album})"
+
+class PlaylistIndex:
+    """In-memory index of tracks across all audio playlists.
+
+    Built in one pass over the playlists using the artist/album titles that
+    come back with each item, so queries never go back to the server.
+    """
+
+    def __init__(self):
+        self.playlists = {}                # playlist title -> Playlist
+        self.tracks = {}                   # playlist title -> [Track]
+        self.keys = {}                     # playlist title -> set of ratingKeys
+        self.track_info = {}               # ratingKey -> Track
+        self.by_key = defaultdict(set)     # ratingKey -> playlist titles
+        self.by_artist = defaultdict(set)  # lowercased artist -> playlist titles
+        self.by_album = defaultdict(set)   # lowercased album -> playlist titles
+
+    @classmethod
+    def from_server(cls, plex):
+        """Fetch every audio playlist and its items and index them."""
+        index = cls()
+        for playlist in plex.playlists():
+            if playlist.playlistType == 'audio':
+                index.add_playlist(playlist, playlist.items())
+        return index
+
+    def add_playlist(self, playlist, items):
+        title = playlist.title
+        tracks = [
+            Track(item.ratingKey, item.title,
+                  getattr(item, "grandparentTitle", None) or "Unknown Artist",
+                  getattr(item, "parentTitle", None) or "Unknown Album")
+            for item in items
+        ]
+        self.playlists[title] = playlist
+        self.tracks[title] = tracks
+        self.keys[title] = {t.rating_key for t in tracks}
+        for t in tracks:
+            self.track_info[t.rating_key] = t
+            self.by_key[t.rating_key].add(title)
+            self.by_artist[t.artist.lower()].add(title)
+            self.by_album[t.album.lower()].add(title)
+
+    def playlists_with_track(self, rating_key):
+        return sorted(self.by_key.get(rating_key, ()))
+
+    def playlists_with_artist(self, artist):
+        return sorted(self.by_artist.get(artist.strip().lower(), ()))
+
+    def playlists_with_album(self, album):
+        return sorted(self.by_album.get(album.strip().lower(), ()))
+
+    def duplicates_within(self, title):
+        """Tracks listed more than once in one playlist, as [(Track, count)]."""
+        counts = Counter(t.rating_key for t in self.tracks.get(title, ()))
+        return [(self.track_info[k], n) for k, n in counts.items() if n > 1]
+
+    def duplicates_across(self):
+        """Tracks found in more than one playlist, as [(Track, [playlist titles])]."""
+        return [(self.track_info[k], sorted(titles))
+                for k, titles in self.by_key.items() if len(titles) > 1]
+
+    def overlap(self, first, second):
+        """Shared tracks between two playlists and their Jaccard similarity.
+
+        Raises ValueError if either playlist is not in the index.
+        """
+        for title in (first, second):
+            if title not in self.keys:
+                raise ValueError(f"Unknown playlist: {title}")
+        a, b = self.keys[first], self.keys[second]
+        shared = a & b
+        union = a | b
+        return [self.track_info[k] for k in shared], (len(shared) / len(union) if union else 0.0)
+
+    # Text reports shared by the GUI and the command line
+
+    def artist_report(self, artist):
+        titles = self.playlists_with_artist(artist)
+        if not titles:
+            return f"No playlists contain the artist '{artist}'."
+        return "\n".join([f"Playlists containing the artist '{artist}':"] + [f"- {t}" for t in titles])
+
+    def album_report(self, album):
+        titles = self.playlists_with_album(album)
+        if not titles:
+            return f"No playlists contain the album '{album}'."
+        return "\n".join([f"Playlists containing the album '{album}':"] + [f"- {t}" for t in titles])
+
+    def duplicates_report(self):
+        lines = ["Duplicate tracks within playlists:"]
+        for title in sorted(self.tracks):
+            for track, count in self.duplicates_within(title):
+                lines.append(f"- {title}: {format_track(track)} x{count}")
+        if len(lines) == 1:
+            lines.append("- None")
+        lines.append("")
+        lines.append("Tracks in more than one playlist:")
+        across = sorted(self.duplicates_across(), key=lambda d: (d[0].artist, d[0].title))
+        for track, titles in across:
+            lines.append(f"- {format_track(track)}: {', '.join(titles)}")
+        if not across:
+            lines.append("- None")
+        return "\n".join(lines)
+
+    def playlist_report(self, title):
+        playlist = self.playlists[title]
+        duration_seconds = playlist.duration / 1000  # Convert milliseconds to seconds
+        duration_minutes = round(duration_seconds / 60, 2)
+
+        lines = [f"Songs in Playlist: {title} (Duration: {duration_minutes} minutes)\n"]
+        lines += [f"- {format_track(t)}" for t in self.tracks[title]]
+        return "\n".join(lines)
+
+    def overlap_report(self, first, second):
+        shared, similarity = self.overlap(first, second)
+        lines = [f"Overlap between {first} and {second}: {len(shared)} shared track(s), "
+                 f"{similarity:.0%} similar"]
+        lines += [f"- {format_track(t)}" for t in sorted(shared, key=lambda t: (t.artist, t.title))]
+        return "\n".join(lines)
+
 class PlexPlaylistApp:
-    def __init__(self, root, ip, token):
+    def __init__(self, root, ip, token, baseurl=None):
         self.root = root
         self.root.title("Plex Musical Playlist Viewer")
         self.root.geometry("600x400")  # Set initial size
@@ -70,19 +452,17 @@ class PlexPlaylistApp:
         self.root.rowconfigure(0, weight=1)
         self.root.columnconfigure(0, weight=1)
 
-        self.baseurl = f"http://{ip}:32400"
-        self.token = token
-        self.plex = PlexServer(self.baseurl, self.token)
-        self.music_playlists = []
+        self.metrics = RequestMetrics()
+        self.plex = connect(ip, token, self.metrics, baseurl)
+        self.index = None
         self.current_playlist_data = None  
 
         self.load_music_playlists()
 
     def load_music_playlists(self):
-        playlists = self.plex.playlists()
-        self.music_playlists = [playlist for playlist in playlists if playlist.playlistType == 'audio']
+        self.index = PlaylistIndex.from_server(self.plex)
 
-        if not self.music_playlists:
+        if not self.index.playlists:
             messagebox.showinfo("No Playlists", "No music playlists found on the server.")
             return
 
@@ -92,7 +472,7 @@ class PlexPlaylistApp:
         self.frame = ttk.Frame(self.root, padding="10")
         self.frame.grid(row=0, column=0, sticky="nsew")
 
-        self.frame.rowconfigure(2, weight=1)
+        self.frame.rowconfigure(4, weight=1)
         self.frame.columnconfigure(0, weight=1)
         self.frame.columnconfigure(1, weight=1)
 
@@ -100,52 +480,98 @@ class PlexPlaylistApp:
 
         self.playlist_var = tk.StringVar()
         self.playlist_dropdown = ttk.Combobox(self.frame, textvariable=self.playlist_var, state="readonly")
-        self.playlist_dropdown['values'] = [playlist.title for playlist in self.music_playlists]
+        self.playlist_dropdown['values'] = list(self.index.playlists)
         self.playlist_dropdown.grid(row=0, column=1, padx=5, pady=5)
 
-        ttk.Button(self.frame, text="View Songs", command=self.display_songs).grid(row=1, column=0, columnspan=2, pady=10)
+        ttk.Label(self.frame, text="Compare With:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
+
+        self.compare_var = tk.StringVar()
+        self.compare_dropdown = ttk.Combobox(self.frame, textvariable=self.compare_var, state="readonly")
+        self.compare_dropdown['values'] = list(self.index.playlists)
+        self.compare_dropdown.grid(row=1, column=1, padx=5, pady=5)
+
+        view_frame = ttk.Frame(self.frame)
+        view_frame.grid(row=2, column=0, columnspan=2, pady=10)
+
+        ttk.Button(view_frame, text="View Songs", command=self.display_songs).grid(row=0, column=0, padx=5)
+        ttk.Button(view_frame, text="Compare", command=self.display_overlap).grid(row=0, column=1, padx=5)
+        ttk.Button(view_frame, text="Duplicates", command=self.display_duplicates).grid(row=0, column=2, padx=5)
+        ttk.Button(view_frame, text="Request Stats", command=self.display_stats).grid(row=0, column=3, padx=5)
+
+        # Search across all playlists by artist or album
+        search_frame = ttk.Frame(self.frame)
+        search_frame.grid(row=3, column=0, columnspan=2, pady=5)
+
+        self.search_var = tk.StringVar()
+        ttk.Entry(search_frame, textvariable=self.search_var).grid(row=0, column=0, padx=5)
+        ttk.Button(search_frame, text="Find Artist", command=self.find_artist).grid(row=0, column=1, padx=5)
+        ttk.Button(search_frame, text="Find Album", command=self.find_album).grid(row=0, column=2, padx=5)
 
         self.text_window = tk.Text(self.frame, wrap="word", state="disabled")
-        self.text_window.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
+        self.text_window.grid(row=4, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
 
         # Add Export and Close buttons
         buttons_frame = ttk.Frame(self.frame)
-        buttons_frame.grid(row=3, column=0, columnspan=2, pady=10, sticky="e")
+        buttons_frame.grid(row=5, column=0, columnspan=2, pady=10, sticky="e")
 
         ttk.Button(buttons_frame, text="Export", command=self.export_playlist).grid(row=0, column=0, padx=5)
         ttk.Button(buttons_frame, text="Close", command=self.root.destroy).grid(row=0, column=1, padx=5)
 
+        # Running request count/latency for the Plex connection
+        self.status_var = tk.StringVar(value=self.metrics.summary())
+        ttk.Label(self.frame, textvariable=self.status_var).grid(row=6, column=0, columnspan=2, sticky="w", padx=5)
+
     def display_songs(self):
         selected_title = self.playlist_var.get()
         if not selected_title:
             messagebox.showerror("Selection Error", "Please select a playlist from the dropdown.")
             return
 
-        selected_playlist = next((playlist for playlist in self.music_playlists if playlist.title == selected_title), None)
-        if not selected_playlist:
+        if selected_title not in self.index.playlists:
             messagebox.showerror("Playlist Error", "Unable to find the selected playlist.")
             return
 
-        songs = selected_playlist.items()
-        duration_seconds = selected_playlist.duration / 1000  # Convert milliseconds to seconds
-        duration_minutes = round(duration_seconds / 60, 2)
+        self.show_text(self.index.playlist_report(selected_title))
+
+    def display_overlap(self):
+        first, second = self.playlist_var.get(), self.compare_var.get()
+        if not first or not second:
+            messagebox.showerror("Selection Error", "Please select two playlists to compare.")
+            return
+        try:
+            self.show_text(self.index.overlap_report(first, second))
+        except ValueError as e:
+            messagebox.showerror("Playlist Error", str(e))
 
-        playlist_data = [f"Songs in Playlist: {selected_playlist.title} (Duration: {duration_minutes} minutes)\n"]
-        for song in songs:
-            artist = song.artist()
-            artist_name = artist.title if artist else "Unknown Artist"
+    def display_duplicates(self):
+        self.show_text(self.index.duplicates_report())
 
-            album = song.album()
-            album_name = album.title if album else "Unknown Album"
+    def display_stats(self):
+        self.show_text(self.metrics.report())
 
-            playlist_data.append(f"- {song.title} by {artist_name} (Album: {album_name})")
+    def find_artist(self):
+        artist = self.search_var.get().strip()
+        if not artist:
+            messagebox.showerror("Search Error", "Please enter an artist to search for.")
+            return
+        self.show_text(self.index.artist_report(artist))
+
+    def find_album(self):
+        album = self.search_var.get().strip()
+        if not album:
+            messagebox.showerror("Search Error", "Please enter an album to search for.")
+            return
+        self.show_text(self.index.album_report(album))
 
-        self.current_playlist_data = "\n".join(playlist_data)
+    def show_text(self, text):
+        """Show a report in the text window and keep it for export."""
+        self.current_playlist_data = text
 
         self.text_window.configure(state="normal")
         self.text_window.delete("1.0", "end")
         self.text_window.insert("end", self.current_playlist_data)
         self.text_window.configure(state="disabled")
+        self.status_var.set(self.metrics.summary())
 
     def export_playlist(self):
         if not self.current_playlist_data:
@@ -165,12 +591,63 @@ class PlexPlaylistApp:
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to save the playlist: {e}")
 
+def run_cli(args, credentials):
+    """Answer playlist queries from the command line without the UI."""
+    metrics = RequestMetrics()
+    index = PlaylistIndex.from_server(connect(credentials['ip'], credentials['token'], metrics, args.url))
+    if args.artist:
+        print(index.artist_report(args.artist))
+    if args.album:
+        print(index.album_report(args.album))
+    if args.duplicates:
+        print(index.duplicates_report())
+    if args.overlap:
+        print(index.overlap_report(*args.overlap))
+    if args.export:
+        os.makedirs(args.export, exist_ok=True)
+        for title in index.playlists:
+            safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in title)
+            file_path = os.path.join(args.export, f"{safe_title}.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(index.playlist_report(title))
+        print(f"Exported {len(index.playlists)} playlist(s) to {args.export}")
+    if args.stats:
+        print(metrics.report())
+
 # Main Application
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="View and analyse Plex music playlists. Launches the UI when no query is given.")
+    parser.add_argument("-A", "--artist", dest="artist", help="List playlists containing this artist.")
+    parser.add_argument("-L", "--album", dest="album", help="List playlists containing this album.")
+    parser.add_argument("-D", "--duplicates", dest="duplicates", action="store_true", help="Report duplicate tracks within and across playlists.")
+    parser.add_argument("-O", "--overlap", dest="overlap", nargs=2, metavar="PLAYLIST", help="Report tracks shared by two playlists.")
+    parser.add_argument("-E", "--export", dest="export", metavar="DIR", help="Export every music playlist to a txt file in this directory.")
+    parser.add_argument("-N", "--server", dest="server", help="Name of the stored Plex server to use (default server if omitted).")
+    parser.add_argument("--list-servers", dest="list_servers", action="store_true", help="List stored Plex server names and exit.")
+    parser.add_argument("--add-server", dest="add_server", metavar="NAME", help="Prompt for and store credentials for a new server, then exit.")
+    parser.add_argument("--remove-server", dest="remove_server", metavar="NAME", help="Remove a stored server's credentials, then exit.")
+    parser.add_argument("-S", "--stats", dest="stats", action="store_true", help="Print Plex request counts and latency after the query.")
+    parser.add_argument("-U", "--url", dest="url", help="Plex server URL, overriding the stored IP (e.g. a local test server).")
+    args = parser.parse_args()
+
     try:
-        credentials = get_plex_credentials()
-        root = Tk()
-        app = PlexPlaylistApp(root, credentials['ip'], credentials['token'])
-        root.mainloop()
+        headless = args.artist or args.album or args.duplicates or args.overlap or args.export
+        if args.list_servers:
+            print("\n".join(get_credential_store().names()) or "No stored Plex servers.")
+        elif args.add_server:
+            prompt_plex_credentials(args.add_server)
+            print(f"Stored credentials for {args.add_server}")
+        elif args.remove_server:
+            if get_credential_store().remove(args.remove_server):
+                print(f"Removed credentials for {args.remove_server}")
+            else:
+                print(f"No stored credentials for {args.remove_server}")
+        elif headless:
+            run_cli(args, get_plex_credentials(args.server, prompt=False))
+        else:
+            credentials = get_plex_credentials(args.server)
+            root = Tk()
+            app = PlexPlaylistApp(root, credentials['ip'], credentials['token'], args.url)
+            root.mainloop()
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,95 @@
+# MOCK_SERVER_CHECK: Exercise the Plex HTTP session layer against a local mock server.
+# Starts a minimal fake Plex server that fails some requests with 503, indexes its
+# playlists through connect(), and checks that retries and request metrics add up.
+# Exits non-zero if any check fails. No real Plex server or credentials are needed.
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from plexapi.exceptions import BadRequest
+
+from PlexPlaylist import PlaylistIndex, RequestMetrics, connect, MAX_RETRIES
+
+TRACK = '<Track ratingKey="{0}" key="/library/metadata/{0}" type="track" title="{1}" grandparentTitle="{2}" parentTitle="{3}"/>'
+
+PAGES = {
+    "/": '<MediaContainer friendlyName="Mock" machineIdentifier="mock" version="1.40.0"/>',
+    "/playlists": (
+        '<MediaContainer size="2">'
+        '<Playlist ratingKey="1" key="/playlists/1/items" type="playlist" title="Mix" playlistType="audio" duration="60000"/>'
+        '<Playlist ratingKey="2" key="/playlists/2/items" type="playlist" title="Rock" playlistType="audio" duration="60000"/>'
+        '</MediaContainer>'
+    ),
+    "/playlists/1/items": "<MediaContainer>" + TRACK.format(10, "Song 1", "ABBA", "Gold")
+                          + TRACK.format(11, "Song 2", "Queen", "Hits") + "</MediaContainer>",
+    "/playlists/2/items": "<MediaContainer>" + TRACK.format(11, "Song 2", "Queen", "Hits") + "</MediaContainer>",
+}
+
+# Paths that answer 503 a number of times before succeeding (None = always fail)
+FAILURES = {"/playlists": 2, "/unavailable": None}
+
+class MockPlexHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    hits = {}  # path -> round trips seen by the server
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        with self.lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+            remaining = FAILURES.get(path, 0)
+            fail = remaining is None or remaining > 0
+            if remaining:
+                FAILURES[path] = remaining - 1
+
+        body = PAGES.get(path, "").encode()
+        status = 503 if fail else (200 if path in PAGES else 404)
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml")
+        self.send_header("Content-Length", str(0 if fail else len(body)))
+        self.end_headers()
+        if not fail:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass  # keep the check output quiet
+
+def check(description, actual, expected):
+    ok = actual == expected
+    print(f"{'OK  ' if ok else 'FAIL'} {description}: {actual!r}" + ("" if ok else f" (expected {expected!r})"))
+    return ok
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockPlexHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    baseurl = f"http://127.0.0.1:{server.server_address[1]}"
+
+    metrics = RequestMetrics()
+    plex = connect(None, "mock-token", metrics, baseurl)
+    index = PlaylistIndex.from_server(plex)
+    try:
+        plex.query("/unavailable")
+    except BadRequest:
+        pass  # expected once retries are exhausted
+
+    server.shutdown()
+    print(metrics.report())
+    print("")
+
+    hits = MockPlexHandler.hits
+    results = [
+        check("playlists indexed", sorted(index.playlists), ["Mix", "Rock"]),
+        check("playlists containing Queen", index.playlists_with_artist("queen"), ["Mix", "Rock"]),
+        check("requests", metrics.requests, 5),
+        check("round trips match the server", metrics.round_trips, sum(hits.values())),
+        check("retried /playlists round trips", metrics.by_path["/playlists"][1], hits["/playlists"]),
+        check("exhausted /unavailable round trips", metrics.by_path["/unavailable"][1], MAX_RETRIES + 1),
+        check("errors", metrics.errors, 1),
+        check("retries by reason", dict(metrics.retries), {"503": 2 + MAX_RETRIES}),
+        check("items requests grouped by endpoint", metrics.by_path["/playlists/{id}/items"][0], 2),
+    ]
+    sys.exit(0 if all(results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -2,24 +2,31 @@
 # Capture, update, and document software risk, policies, and integrations.
 # Generate PDF or Word reports for record-keeping or manual review.
 
+import html
+import io
 import json
+import math
 import os
 import sys
+from collections import Counter
 from datetime import datetime
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.enums import TA_CENTER
-from reportlab.lib import colors
-from docx import Document
-from docx.shared import Pt
-from docx.enum.table import WD_TABLE_ALIGNMENT
+
+# reportlab and python-docx are imported inside the report functions that use
+# them, so listing and editing reviews starts without loading either stack.
 
 # ------------------- CONFIG -------------------
 
 REVIEW_DIR = "reviews"
 os.makedirs(REVIEW_DIR, exist_ok=True)
 
+# Portfolio roll-up: per-review summaries cached so saves update it incrementally
+PORTFOLIO_CACHE = os.path.join(REVIEW_DIR, "portfolio.cache")
+SCORE_KEYS = ["def_general", "def_security", "def_compliance"]
+RISK_ORDER = ["Low", "Moderate", "High"]
+APPROVAL_ORDER = ["Approved", "Conditional", "Denied", "Pending"]
+PENDING_OVERDUE_DAYS = 30     # unapproved reviews older than this are overdue
+REREVIEW_OVERDUE_DAYS = 365   # approved reviews are re-reviewed yearly
+
 YES_NO_QUESTIONS = [
     "privacy_policy", "tos_reviewed", "data_sharing", "pentesting"
 ]
@@ -63,6 +70,17 @@ QUESTIONS = [
     ("approval_date", "Approval date:"),
 ]
 
+# Report layout shared by the PDF and Word generators
+REPORT_SECTIONS = {
+    "General Information": ["software_name", "software_vendor", "version", "use_case", "overview"],
+    "Policies & Data Handling": ["privacy_policy", "privacy_notes", "tos_reviewed", "tos_notes",
+                                 "data_sharing", "data_sharing_notes", "data_collected", "data_storage"],
+    "Security Practices": ["pentesting", "pentest_details", "certifications", "auth_controls", "encryption"],
+    "Defender Scores": ["def_general", "def_security", "def_compliance", "def_notes"],
+    "Integrations": ["integrations", "integration_data", "integration_security"],
+    "Risk & Approval": ["risk_level", "key_risks", "mitigations", "approval", "approver", "approval_date"]
+}
+
 # ------------------- HELPER FUNCTIONS -------------------
 
 def safe_input(prompt):
@@ -74,6 +92,16 @@ def safe_input(prompt):
         print("***Input cancelled by user. Returning to menu***")
         return None
 
+def normalize_answer(key, raw_answer):
+    """Return an answer as report text, with yes/no answers shown as Y/N."""
+    if key in YES_NO_QUESTIONS and isinstance(raw_answer, str):
+        low = raw_answer.strip().lower()
+        if low in ("y", "yes"):
+            return "Y"
+        if low in ("n", "no"):
+            return "N"
+    return "" if raw_answer is None else str(raw_answer)
+
 def list_reviews():
     """List existing JSON reviews and allow selection."""
     files = [f for f in os.listdir(REVIEW_DIR) if f.endswith(".json")]
@@ -102,6 +130,7 @@ def load_review(path=None):
 def save_review(data, path):
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
+    update_portfolio_cache(data, path)
 
 # ------------------- REVIEW FUNCTIONS -------------------
 
@@ -149,6 +178,12 @@ def continue_review():
 
 def generate_pdf():
     """Generate PDF with wrapped table cells."""
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib import colors
+
     existing = list_reviews()
     if not existing:
         return
@@ -201,17 +236,8 @@ def generate_pdf():
         ]
 
         for k in keys:
-            raw_answer = data.get(k, "")
-            # Normalize yes/no
-            if k in YES_NO_QUESTIONS and isinstance(raw_answer, str):
-                low = raw_answer.strip().lower()
-                if low in ("y", "yes"):
-                    raw_answer = "Y"
-                elif low in ("n", "no"):
-                    raw_answer = "N"
-            # Ensure string and preserve line breaks with <br/>
-            ans_text = "" if raw_answer is None else str(raw_answer)
-            ans_text = ans_text.replace("\n", "<br/>")
+            # Preserve line breaks with <br/>
+            ans_text = normalize_answer(k, data.get(k, "")).replace("\n", "<br/>")
             q_text = k.replace("_", " ").title()
             rows.append([
                 Paragraph(q_text, body_style),
@@ -232,43 +258,36 @@ def generate_pdf():
         story.append(table)
         story.append(Spacer(1, 12))
 
-    # Sections (with updated General Information)
-    section("General Information", ["software_name", "software_vendor", "version", "use_case", "overview"])
-    section("Policies & Data Handling",
-            ["privacy_policy", "privacy_notes", "tos_reviewed", "tos_notes",
-             "data_sharing", "data_sharing_notes", "data_collected", "data_storage"])
-    section("Security Practices",
-            ["pentesting", "pentest_details", "certifications", "auth_controls", "encryption"])
-    section("Defender Scores",
-            ["def_general", "def_security", "def_compliance", "def_notes"])
-    section("Integrations",
-            ["integrations", "integration_data", "integration_security"])
-    section("Risk & Approval",
-            ["risk_level", "key_risks", "mitigations", "approval", "approver", "approval_date"])
+    for title, keys in REPORT_SECTIONS.items():
+        section(title, keys)
 
     pdf.build(story)
     print(f"PDF exported as {filename}")
 
 # ------------------- WORD REPORT (table-style) -------------------
 
-def generate_blank_word_report():
-    """Generate a blank Word doc with section tables (Question | Answer)."""
+_word_template = None  # serialized skeleton, built once per run
+
+def build_word_template():
+    """Build the section/table skeleton once and cache it as .docx bytes.
+
+    Answer cells hold a single pre-styled empty run, so filling a review only
+    needs to set that run's text instead of re-running the style loops.
+    """
+    from docx import Document
+    from docx.shared import Pt
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+
+    global _word_template
+    if _word_template is not None:
+        return _word_template
+
     doc = Document()
     doc.add_heading("Software Security Review", 0)
 
-    sections = {
-        "General Information": ["software_name", "software_vendor", "version", "use_case", "overview"],
-        "Policies & Data Handling": ["privacy_policy", "privacy_notes", "tos_reviewed", "tos_notes",
-                                     "data_sharing", "data_sharing_notes", "data_collected", "data_storage"],
-        "Security Practices": ["pentesting", "pentest_details", "certifications", "auth_controls", "encryption"],
-        "Defender Scores": ["def_general", "def_security", "def_compliance", "def_notes"],
-        "Integrations": ["integrations", "integration_data", "integration_security"],
-        "Risk & Approval": ["risk_level", "key_risks", "mitigations", "approval", "approver", "approval_date"]
-    }
-
     qdict = dict(QUESTIONS)
 
-    for sec, keys in sections.items():
+    for sec, keys in REPORT_SECTIONS.items():
         doc.add_heading(sec, level=1)
 
         table = doc.add_table(rows=1, cols=2)
@@ -292,10 +311,368 @@ def generate_blank_word_report():
 
         doc.add_paragraph("\n")
 
-    filename = "Blank_Software_Security_Review.docx"
+    buf = io.BytesIO()
+    doc.save(buf)
+    _word_template = buf.getvalue()
+    return _word_template
+
+def fill_word_report(data, filename):
+    """Write a filled Word report for one review from the cached template."""
+    from docx import Document
+
+    doc = Document(io.BytesIO(build_word_template()))
+    for table, keys in zip(doc.tables, REPORT_SECTIONS.values()):
+        for row, k in zip(table.rows[1:], keys):
+            row.cells[1].paragraphs[0].runs[0].text = normalize_answer(k, data.get(k, ""))
     doc.save(filename)
+
+def generate_blank_word_report():
+    """Generate a blank Word doc with section tables (Question | Answer)."""
+    filename = "Blank_Software_Security_Review.docx"
+    with open(filename, "wb") as f:
+        f.write(build_word_template())
     print(f"Blank Word report created: {filename}")
 
+def generate_word_report():
+    """Generate a filled Word report for a selected review."""
+    existing = list_reviews()
+    if not existing:
+        return
+    data, _ = load_review(existing)
+
+    software = data.get("software_name", "Unknown Software")
+    filename = f"{software.replace(' ', '_')}_security_review.docx"
+    fill_word_report(data, filename)
+    print(f"Word report exported as {filename}")
+
+def generate_all_word_reports():
+    """Generate filled Word reports for every saved review."""
+    files = sorted(f for f in os.listdir(REVIEW_DIR) if f.endswith(".json"))
+    if not files:
+        print("")
+        print("***No saved reviews found***")
+        return
+
+    created = 0
+    for f in files:
+        try:
+            data, _ = load_review(os.path.join(REVIEW_DIR, f))
+        except (OSError, ValueError):
+            print(f"*** Skipping unreadable review {f} ***")
+            continue
+        # Name reports after the review file so reviews sharing a software
+        # name do not overwrite each other
+        filename = f"{f.replace('.json', '')}_security_review.docx"
+        fill_word_report(data, filename)
+        created += 1
+        print(f"Word report exported as {filename}")
+    print(f"\n{created} Word report(s) created.")
+
+# ------------------- PORTFOLIO REPORT -------------------
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(str(value).strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+def _parse_score(value):
+    """Parse a Defender score such as '7', '7.5' or '7/10'; None if not a finite number."""
+    try:
+        score = float(str(value).strip().split("/")[0])
+    except ValueError:
+        return None
+    return score if math.isfinite(score) else None
+
+def summarize_review(data):
+    """Reduce a review to the fields the portfolio report needs."""
+    certs = str(data.get("certifications", "")).replace(";", ",").split(",")
+    return {
+        "software_name": data.get("software_name", ""),
+        "risk_level": str(data.get("risk_level", "")).strip().title() or "Unspecified",
+        "approval": str(data.get("approval", "")).strip().title() or "Pending",
+        "certifications": [c.strip() for c in certs
+                           if c.strip() and c.strip().lower() not in ("none", "n/a", "na")],
+        "scores": {k: _parse_score(data.get(k, "")) for k in SCORE_KEYS},
+        "review_date": data.get("review_date") or data.get("date_submitted", ""),
+    }
+
+def is_overdue(summary, today):
+    """Pending reviews go stale after 30 days, approvals after a year."""
+    reviewed = _parse_date(summary["review_date"])
+    if reviewed is None or summary["approval"] == "Denied":
+        return False
+    if summary["approval"] in ("Approved", "Conditional"):
+        limit = REREVIEW_OVERDUE_DAYS
+    else:
+        limit = PENDING_OVERDUE_DAYS
+    return (today - reviewed).days > limit
+
+def load_portfolio_cache():
+    try:
+        with open(PORTFOLIO_CACHE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_portfolio_cache(cache):
+    with open(PORTFOLIO_CACHE, "w") as f:
+        json.dump(cache, f, indent=2)
+
+def update_portfolio_cache(data, path):
+    """Refresh the cached summary for a single review after it is saved."""
+    cache = load_portfolio_cache()
+    cache[os.path.basename(path)] = {
+        "mtime": os.path.getmtime(path),
+        "summary": summarize_review(data),
+    }
+    save_portfolio_cache(cache)
+
+def aggregate_reviews():
+    """Roll up every review in one pass, reusing cached summaries where current."""
+    cache = load_portfolio_cache()
+    today = datetime.now().date()
+    agg = {
+        "total": 0,
+        "risk_levels": Counter(),
+        "approvals": Counter(),
+        "certified": 0,
+        "certifications": Counter(),
+        "scores": {k: {"count": 0, "sum": 0.0, "min": None, "max": None, "buckets": Counter()}
+                   for k in SCORE_KEYS},
+        "overdue": [],
+    }
+    seen = set()
+    changed = False
+
+    for entry in os.scandir(REVIEW_DIR):
+        if not entry.name.endswith(".json"):
+            continue
+        seen.add(entry.name)
+        mtime = entry.stat().st_mtime
+        cached = cache.get(entry.name)
+        if not cached or cached.get("mtime") != mtime:
+            try:
+                data, _ = load_review(entry.path)
+            except (OSError, ValueError):
+                continue  # skip unreadable reviews
+            cached = {"mtime": mtime, "summary": summarize_review(data)}
+            cache[entry.name] = cached
+            changed = True
+        summary = cached["summary"]
+
+        agg["total"] += 1
+        agg["risk_levels"][summary["risk_level"]] += 1
+        agg["approvals"][summary["approval"]] += 1
+        if summary["certifications"]:
+            agg["certified"] += 1
+            agg["certifications"].update(c.upper() for c in summary["certifications"])
+        for k, score in summary["scores"].items():
+            if score is None or not math.isfinite(score):
+                continue  # also skips NaN/inf cached by earlier versions
+            stats = agg["scores"][k]
+            stats["count"] += 1
+            stats["sum"] += score
+            stats["min"] = score if stats["min"] is None else min(stats["min"], score)
+            stats["max"] = score if stats["max"] is None else max(stats["max"], score)
+            stats["buckets"][int(score)] += 1
+        if is_overdue(summary, today):
+            agg["overdue"].append(summary)
+
+    for name in set(cache) - seen:
+        del cache[name]
+        changed = True
+    if changed:
+        save_portfolio_cache(cache)
+    return agg
+
+def _ordered(counter, order):
+    """Counter items with known labels first, in their natural order."""
+    keys = [k for k in order if k in counter] + sorted(k for k in counter if k not in order)
+    return [(k, counter[k]) for k in keys]
+
+def portfolio_tables(agg):
+    """Tables for the portfolio report as (title, header, rows)."""
+    total = agg["total"]
+    pct = lambda n: f"{n / total:.0%}" if total else "0%"
+    tables = [
+        ("Risk Levels", ["Risk Level", "Reviews", "Share"],
+         [[k, str(v), pct(v)] for k, v in _ordered(agg["risk_levels"], RISK_ORDER)]),
+        ("Approval Status", ["Status", "Reviews", "Share"],
+         [[k, str(v), pct(v)] for k, v in _ordered(agg["approvals"], APPROVAL_ORDER)]),
+        ("Certification Coverage", ["Certification", "Reviews", "Share"],
+         [["Any certification", str(agg["certified"]), pct(agg["certified"])]] +
+         [[k, str(v), pct(v)] for k, v in agg["certifications"].most_common()]),
+    ]
+    score_rows = []
+    for k in SCORE_KEYS:
+        stats = agg["scores"][k]
+        if stats["count"]:
+            avg = stats["sum"] / stats["count"]
+            score_rows.append([k.replace("_", " ").title(), str(stats["count"]),
+                               f"{stats['min']:g}", f"{avg:.1f}", f"{stats['max']:g}"])
+        else:
+            score_rows.append([k.replace("_", " ").title(), "0", "-", "-", "-"])
+    tables.append(("Defender Scores", ["Score", "Scored", "Min", "Avg", "Max"], score_rows))
+    tables.append((f"Overdue Reviews ({len(agg['overdue'])})", ["Software", "Approval", "Review Date"],
+                   [[s["software_name"], s["approval"], s["review_date"]] for s in agg["overdue"]]))
+    return tables
+
+def portfolio_charts(agg):
+    """Bar chart data for the portfolio report as (title, [(label, value)])."""
+    charts = [("Reviews by Risk Level", _ordered(agg["risk_levels"], RISK_ORDER)),
+              ("Reviews by Approval Status", _ordered(agg["approvals"], APPROVAL_ORDER))]
+    for k in SCORE_KEYS:
+        buckets = agg["scores"][k]["buckets"]
+        charts.append((f"{k.replace('_', ' ').title()} Distribution",
+                       [(str(b), buckets[b]) for b in sorted(buckets)]))
+    return [(title, pairs) for title, pairs in charts if pairs]
+
+def _pdf_bar_chart(title, pairs, width):
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.lib import colors
+
+    drawing = Drawing(width, 170)
+    chart = VerticalBarChart()
+    chart.x, chart.y = 40, 30
+    chart.width, chart.height = width - 80, 110
+    chart.data = [[v for _, v in pairs]]
+    chart.categoryAxis.categoryNames = [label for label, _ in pairs]
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueStep = max(1, max(v for _, v in pairs) // 5)
+    chart.bars[0].fillColor = colors.lightblue
+    drawing.add(chart)
+    drawing.add(String(width / 2, 155, title, textAnchor="middle",
+                       fontName="Helvetica-Bold", fontSize=10))
+    return drawing
+
+def write_portfolio_pdf(agg, filename):
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib import colors
+
+    pdf = SimpleDocTemplate(filename, pagesize=letter)
+    styles = getSampleStyleSheet()
+    body_style = styles["BodyText"]
+    story = [
+        Paragraph("Software Security Portfolio", ParagraphStyle(
+            name="TitleStyle", fontName="Helvetica-Bold", fontSize=20,
+            alignment=TA_CENTER, spaceAfter=12)),
+        Paragraph(f"Reviews: {agg['total']} | Date: {datetime.now().date()}", ParagraphStyle(
+            name="SubStyle", fontName="Helvetica", fontSize=10,
+            alignment=TA_CENTER, spaceAfter=12)),
+    ]
+
+    for title, header, rows in portfolio_tables(agg):
+        story.append(Paragraph(f"<b>{title}</b>", styles['Heading3']))
+        story.append(Spacer(1, 4))
+        cells = [[Paragraph(f"<b>{h}</b>", body_style) for h in header]]
+        cells += [[Paragraph(html.escape(c), body_style) for c in row] for row in rows]
+        table = Table(cells, hAlign='LEFT',
+                      colWidths=[pdf.width / len(header)] * len(header))
+        table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightblue),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]))
+        story.append(table)
+        story.append(Spacer(1, 12))
+
+    for title, pairs in portfolio_charts(agg):
+        story.append(_pdf_bar_chart(title, pairs, pdf.width))
+        story.append(Spacer(1, 12))
+
+    pdf.build(story)
+
+def write_portfolio_docx(agg, filename):
+    from docx import Document
+    from docx.shared import Pt
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+
+    doc = Document()
+    doc.add_heading("Software Security Portfolio", 0)
+    doc.add_paragraph(f"Reviews: {agg['total']} | Date: {datetime.now().date()}")
+
+    for title, header, rows in portfolio_tables(agg):
+        doc.add_heading(title, level=1)
+        table = doc.add_table(rows=1, cols=len(header))
+        table.alignment = WD_TABLE_ALIGNMENT.LEFT
+        for cell, text in zip(table.rows[0].cells, header):
+            cell.paragraphs[0].add_run(text).bold = True
+        for row in rows:
+            for cell, text in zip(table.add_row().cells, row):
+                cell.text = text
+
+    # Word has no native chart support in python-docx; draw text bars instead
+    for title, pairs in portfolio_charts(agg):
+        doc.add_heading(title, level=1)
+        peak = max(v for _, v in pairs)
+        for label, value in pairs:
+            bar = "█" * max(1, round(30 * value / peak)) if value else ""
+            doc.add_paragraph(f"{label:>12}  {bar} {value}").runs[0].font.size = Pt(9)
+
+    doc.save(filename)
+
+def write_portfolio_html(agg, filename):
+    out = ["<!DOCTYPE html>", "<html><head><meta charset=\"utf-8\">",
+           "<title>Software Security Portfolio</title>",
+           "<style>body{font-family:Helvetica,Arial,sans-serif;margin:2em}"
+           "table{border-collapse:collapse;margin-bottom:1em}"
+           "th,td{border:1px solid lightblue;padding:4px 8px;text-align:left}"
+           "th{background:lightblue}.bar{background:steelblue;height:1em;display:inline-block}"
+           "</style></head><body>",
+           "<h1>Software Security Portfolio</h1>",
+           f"<p>Reviews: {agg['total']} | Date: {datetime.now().date()}</p>"]
+
+    for title, header, rows in portfolio_tables(agg):
+        out.append(f"<h3>{html.escape(title)}</h3><table>")
+        out.append("<tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in header) + "</tr>")
+        for row in rows:
+            out.append("<tr>" + "".join(f"<td>{html.escape(c)}</td>" for c in row) + "</tr>")
+        out.append("</table>")
+
+    for title, pairs in portfolio_charts(agg):
+        peak = max(v for _, v in pairs)
+        out.append(f"<h3>{html.escape(title)}</h3><table>")
+        for label, value in pairs:
+            width = round(300 * value / peak) if peak else 0
+            out.append(f"<tr><td>{html.escape(label)}</td>"
+                       f"<td><span class=\"bar\" style=\"width:{width}px\"></span> {value}</td></tr>")
+        out.append("</table>")
+
+    out.append("</body></html>")
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write("\n".join(out))
+
+PORTFOLIO_WRITERS = {
+    "pdf": write_portfolio_pdf,
+    "docx": write_portfolio_docx,
+    "html": write_portfolio_html,
+}
+
+def generate_portfolio_report():
+    """Generate a roll-up report across every saved review."""
+    fmt = safe_input("Report format (PDF/DOCX/HTML, default PDF): ")
+    if fmt is None:
+        return
+    fmt = fmt.lower() or "pdf"
+    if fmt not in PORTFOLIO_WRITERS:
+        print("*** Unknown format, choose PDF, DOCX or HTML. ***")
+        return
+
+    agg = aggregate_reviews()
+    if not agg["total"]:
+        print("")
+        print("***No saved reviews found***")
+        return
+
+    filename = f"Software_Security_Portfolio.{fmt}"
+    PORTFOLIO_WRITERS[fmt](agg, filename)
+    print(f"Portfolio report exported as {filename}")
+
 # ------------------- MAIN MENU -------------------
 
 
@@ -311,7 +688,10 @@ def main():
             print("2. Continue Existing Review")
             print("3. Generate PDF Report")
             print("4. Generate Blank Word Report")
-            print("5. Exit")
+            print("5. Generate Word Report")
+            print("6. Generate Word Reports (All Reviews)")
+            print("7. Generate Portfolio Report")
+            print("8. Exit")
 
             choice = safe_input("Select an option: ")
             if choice is None:
@@ -326,6 +706,12 @@ def main():
             elif choice == "4":
                 generate_blank_word_report()
             elif choice == "5":
+                generate_word_report()
+            elif choice == "6":
+                generate_all_word_reports()
+            elif choice == "7":
+                generate_portfolio_report()
+            elif choice == "8":
                 print("")
                 print("***Goodbye***")
                 break
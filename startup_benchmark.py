@@ -0,0 +1,69 @@
+# STARTUP_BENCHMARK: Check how long the command-line tools take to import.
+# Runs each tool under `python -X importtime` and compares the cumulative
+# import time of the tool module against a budget. Exits non-zero when a tool
+# is over budget so it can be used as a quick regression check.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (label, directory, module)
+TOOLS = [
+    ("Sec_Review", os.path.join(REPO_DIR, "Software Review"), "Sec_Review"),
+    ("LogSearch", os.path.join(REPO_DIR, "LogFile Search"), "LogSearch"),
+]
+
+DEFAULT_BUDGET_MS = 100
+DEFAULT_RUNS = 5
+
+def import_time_us(directory, module):
+    """Import a module in a fresh interpreter and return its cumulative import time."""
+    env = dict(os.environ, PYTHONPATH=directory, PYTHONDONTWRITEBYTECODE="1")
+    # Run from a scratch directory so tools that create folders on import
+    # (Sec_Review creates reviews/) do not touch the working tree.
+    with tempfile.TemporaryDirectory() as scratch:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=scratch, env=env, capture_output=True, text=True
+        )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    for line in reversed(result.stderr.splitlines()):
+        parts = [p.strip() for p in line.replace("import time:", "").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"No import time reported for {module}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Check CLI tool import time against a budget.")
+    parser.add_argument("-B", "--budget", dest="budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Import time budget per tool in milliseconds (default {DEFAULT_BUDGET_MS}).")
+    parser.add_argument("-R", "--runs", dest="runs", type=int, default=DEFAULT_RUNS,
+                        help=f"Runs per tool; the median is compared (default {DEFAULT_RUNS}).")
+    args = parser.parse_args()
+
+    failed = False
+    for label, directory, module in TOOLS:
+        try:
+            times = [import_time_us(directory, module) / 1000 for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{label:<12} ERROR  {e}")
+            failed = True
+            continue
+        median = statistics.median(times)
+        status = "OK" if median <= args.budget else "SLOW"
+        failed = failed or status == "SLOW"
+        print(f"{label:<12} {status:<5}  median {median:7.1f} ms  "
+              f"(min {min(times):.1f}, max {max(times):.1f}, budget {args.budget:g} ms)")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()